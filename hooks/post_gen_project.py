@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import shutil
 import subprocess
@@ -7,20 +8,73 @@ TERMINATOR = " \x1b[0m"
 INFO = " \x1b[1;33m [INFO]: "
 
 
+def _fast_rmtree(root: Path) -> None:
+    """
+    基于 os.scandir 的非递归删除目录树
+    DirEntry 自带文件类型信息，无需对每个条目再做一次 stat；先删除全部文件，再自底向上删除目录
+    """
+    stack = [str(root)]
+    files = []
+    dirs = []
+    while stack:
+        current = stack.pop()
+        dirs.append(current)
+        with os.scandir(current) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    files.append(entry.path)  # 普通文件及符号链接（不跟随链接）
+    for f in files:
+        os.unlink(f)
+    for d in reversed(dirs):
+        os.rmdir(d)
+
+
+def _remove_with_python(p: Path, verbose: bool = False) -> None:
+    """逐个路径删除（未找到系统删除命令时的兜底方式）"""
+    try:
+        if p.is_dir() and not p.is_symlink():
+            _fast_rmtree(p)
+            if verbose:
+                print(f"删除目录: {p}")
+        else:
+            p.unlink()
+            if verbose:
+                print(f"删除文件: {p}")
+    except Exception as e:
+        print(f"删除失败 {p}: {e}")
+
+
 def remove_files_and_folders(*paths: str, verbose: bool = False) -> None:
-    for path in paths:
-        p = Path(path)  # 处理 ~ 和相对路径
-        try:
-            if p.is_dir():
-                shutil.rmtree(p)
-                if verbose:
+    """
+    批量删除文件和目录
+    POSIX 下一次 rm -rf 删除全部路径，Windows 下目录使用 rd /s /q，比逐个 shutil.rmtree 快得多
+    """
+    targets = [p for p in map(Path, paths) if p.exists() or p.is_symlink()]  # 处理 ~ 和相对路径，跳过不存在的路径
+    if not targets:
+        return
+
+    if os.name == "nt":
+        for p in targets:
+            if p.is_dir() and not p.is_symlink():
+                result = subprocess.run(["cmd", "/c", "rd", "/s", "/q", str(p)], check=False)
+                if result.returncode != 0:
+                    print(f"删除失败 {p}: rd 返回码 {result.returncode}")
+                elif verbose:
                     print(f"删除目录: {p}")
             else:
-                p.unlink()
-                if verbose:
-                    print(f"删除文件: {p}")
-        except Exception as e:
-            print(f"删除失败 {p}: {e}")
+                _remove_with_python(p, verbose)
+    elif shutil.which("rm"):
+        result = subprocess.run(["rm", "-rf", "--", *map(str, targets)], check=False)
+        if result.returncode != 0:
+            print(f"删除失败 {', '.join(map(str, targets))}: rm 返回码 {result.returncode}")
+        elif verbose:
+            for p in targets:
+                print(f"删除: {p}")
+    else:
+        for p in targets:
+            _remove_with_python(p, verbose)
 
 
 def remove_example_suffix():
@@ -1,10 +1,16 @@
+import asyncio
 from typing import Annotated
 
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import raiseload
+from sqlalchemy.pool import SingletonThreadPool, StaticPool
 # from sqlalchemy import select
-from sqlmodel import select
+from sqlmodel import func, select
 from ..core.crud import CRUDBase
-from ..core.database.db_manager import DbSessionDep
+from ..core.database.db_manager import AsyncDbSessionDep
 from ..models import Hero, HeroQo
 
 router = APIRouter(
@@ -12,6 +18,10 @@ router = APIRouter(
     tags=["简单示例"],
 )
 hero_crud = CRUDBase[Hero, int](Hero)
+# 数据库读出的 Hero 已是模型实例，无需再按 response_model 校验一遍，直接一次性序列化为可JSON化的数据
+hero_list_adapter = TypeAdapter(list[Hero])
+# 单连接的连接池（SQLite 使用的 StaticPool / SingletonThreadPool），不同会话共用同一个DBAPI连接，不能并发执行语句
+_SINGLE_CONNECTION_POOLS = (StaticPool, SingletonThreadPool)
 
 """
 注意：
@@ -20,32 +30,90 @@ https://www.yuque.com/g/tuonioooo/cyaz9e/oavi27va0nob0826/collaborator/join?toke
 """
 
 
-@router.post("/")
-def create_hero(hero_qo: HeroQo, session: DbSessionDep):
-    return hero_crud.create(session, Hero(**hero_qo.model_dump(exclude_unset=True)))  # 仅提取非默认值的字段（避免覆盖未传字段）
+"""
+路由均为 async def + 异步会话，数据库I/O不占用线程池；
+同步实现的 CRUDBase 通过 AsyncSession.run_sync 在异步会话上执行（首个参数为对应的同步会话）
+"""
+
+
+@router.post("/", response_model=Hero)  # response_model 仅用于生成接口文档
+async def create_hero(hero_qo: HeroQo, session: AsyncDbSessionDep):
+    hero = Hero(**hero_qo.model_dump(exclude_unset=True))  # 仅提取非默认值的字段（避免覆盖未传字段）
+    hero = await session.run_sync(hero_crud.create, hero)
+    return ORJSONResponse(hero.model_dump(mode="json"))  # 直接序列化，不再经过 jsonable_encoder
+
+
+@router.get("/", response_model=list[Hero], response_class=ORJSONResponse)  # response_model 仅用于生成接口文档
+async def read_heroes(
+        session: AsyncDbSessionDep,
+        name: Annotated[str | None, Query(max_length=100)] = None,  # 与 name 列 String(100) 保持一致
+        offset: Annotated[int, Query(ge=0)] = 0,
+        limit: Annotated[int, Query(ge=1, le=100)] = 100,
+        after_id: Annotated[int | None, Query(ge=0)] = None,
+        with_total: bool = False,
+) -> ORJSONResponse:
+    """
+    分页查询英雄列表，过滤与分页全部下推到SQL执行
+    1.偏移分页：offset/limit，with_total=true 时通过响应头 X-Total-Count 返回总数
+    2.游标分页：after_id 为上一页最后一条记录的ID，直接走主键索引定位，不统计总数，
+      若还有下一页，通过响应头 X-Next-Cursor 返回下一页游标（深分页优先使用）
+    直接返回 ORJSONResponse，跳过 FastAPI 对返回值的 response_model 校验
+    """
+    headers = {}
+    stmt = select(Hero).options(raiseload("*"))  # 禁止隐式懒加载，后续新增关联关系时不会在序列化阶段触发 N+1 查询
+    if name:
+        stmt = stmt.where(Hero.name.icontains(name, autoescape=True))  # PostgreSQL下为ILIKE，可命中三元组索引
+
+    if after_id is not None:
+        heroes = (await session.scalars(stmt.where(Hero.id > after_id).order_by(Hero.id).limit(limit))).all()
+        if len(heroes) == limit:
+            headers["X-Next-Cursor"] = str(heroes[-1].id)
+    elif with_total:
+        page_stmt = stmt.order_by(Hero.id).offset(offset).limit(limit)
+        # 会话可能绑定引擎、连接（如事务型测试），或通过 binds 路由，统一解析出实际使用的引擎
+        engine = session.get_bind(Hero).engine
+        if isinstance(engine.pool, _SINGLE_CONNECTION_POOLS):
+            # 单连接池上独立会话会与当前会话共用连接，归还时的回滚会打断进行中的查询，只能在当前会话中依次执行
+            total = await session.scalar(_count_stmt(stmt))
+            heroes = (await session.scalars(page_stmt)).all()
+        else:
+            # 同一个会话不能并发执行语句，总数在独立会话（独立连接）中统计，与分页查询并发执行；
+            # 两条语句不在同一事务快照中，并发写入时总数与当页数据可能存在短暂偏差
+            async with asyncio.TaskGroup() as tg:
+                total_task = tg.create_task(_count(AsyncEngine(engine), stmt))
+                heroes_task = tg.create_task(session.scalars(page_stmt))
+            total = total_task.result()
+            heroes = heroes_task.result().all()
+        headers["X-Total-Count"] = str(total)
+    else:
+        heroes = (await session.scalars(stmt.order_by(Hero.id).offset(offset).limit(limit))).all()
+    return ORJSONResponse(hero_list_adapter.dump_python(heroes, mode="json"), headers=headers)
+
+
+def _count_stmt(stmt):
+    """构造统计查询语句总行数的语句"""
+    return select(func.count()).select_from(stmt.subquery())
 
 
-@router.get("/")
-def read_heroes(
-        session: DbSessionDep,
-        offset: int = 0,
-        limit: Annotated[int, Query(le=100)] = 100,
-) -> list[Hero]:
-    heroes = session.exec(select(Hero).offset(offset).limit(limit)).all()
-    return heroes
+async def _count(bind, stmt) -> int:
+    """在独立的异步会话中统计查询语句的总行数"""
+    async with AsyncSession(bind) as count_session:
+        return await count_session.scalar(_count_stmt(stmt))
 
 
-@router.get("/get/{hero_id}")
-def read_hero(hero_id: int, session: DbSessionDep):
-    return hero_crud.read(session, hero_id)
+@router.get("/get/{hero_id}", response_model=Hero)  # response_model 仅用于生成接口文档
+async def read_hero(hero_id: int, session: AsyncDbSessionDep):
+    hero = await session.run_sync(hero_crud.read, hero_id)
+    return ORJSONResponse(hero.model_dump(mode="json"))  # 直接序列化，不再经过 jsonable_encoder
 
 
-@router.put("/update/{hero_id}")
-def update_hero(hero_id: int, hero_qo: HeroQo, session: DbSessionDep):
-    return hero_crud.update(session, hero_id, Hero(**hero_qo.model_dump(exclude_unset=True)))
+@router.put("/update/{hero_id}", response_model=Hero)  # response_model 仅用于生成接口文档
+async def update_hero(hero_id: int, hero_qo: HeroQo, session: AsyncDbSessionDep):
+    hero = await session.run_sync(hero_crud.update, hero_id, hero_qo)  # 直接传入查询对象，由CRUD只做一次 model_dump
+    return ORJSONResponse(hero.model_dump(mode="json"))
 
 
 @router.delete("/delete/{hero_id}")
-def delete_hero(hero_id: int, session: DbSessionDep):
-    hero_crud.delete(session, hero_id)
+async def delete_hero(hero_id: int, session: AsyncDbSessionDep):
+    await session.run_sync(hero_crud.delete, hero_id)
     return {"ok": True}
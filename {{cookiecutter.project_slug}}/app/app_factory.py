@@ -2,21 +2,30 @@ import asyncio
 from contextlib import asynccontextmanager
 import os
 import sys
+import time
 from datetime import datetime
 
 from fastapi import FastAPI, HTTPException
 from fastapi.exceptions import ResponseValidationError as FastAPIResponseValidationError
+from fastapi.responses import ORJSONResponse
  # 在 Windows 上设置事件循环策略
 if sys.platform == "win32":
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+else:
+    # 非 Windows 平台优先使用 uvloop（fastapi[standard] 已随 uvicorn[standard] 安装），未安装时回退默认事件循环
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
 from app.api import api_router
 from .core.exception_handlers import business_exception_handler, http_exception_handler, \
     fastapi_response_validation_error_handler
 from .core.exceptions import BusinessException
-from .core.logger import setup_uvicorn_log, logger
+from .core.logger import setup_uvicorn_log, start_log_listener, stop_log_listener, logger
 from app.middleware.middleware import setup_middlewares
 from .core.redis import redis_client
-from .core.config import settings
+from .core.config import get_settings, ENV_PATH
 from app.core.database.db_manager import cleanup_database_connections, get_db_manager
 
 # 加载 .env 文件
@@ -27,32 +36,51 @@ from app.core.database.db_manager import cleanup_database_connections, get_db_ma
 async def lifespan(app: FastAPI):
     """
     更优雅、集中管理生命周期逻辑
-    """    # 记录启动时间
-    start_time = datetime.now()
+    """
+    settings = get_settings()
+    # 初始化日志（后续启动日志均依赖于此，需最先执行）；后台日志线程在工作进程内启动
+    start_log_listener()
+    setup_uvicorn_log(access_log=settings.UVICORN_ACCESS_LOG)
+    # 记录启动时间
+    start_ns = time.perf_counter_ns()  # 单调时钟计时，仅用于计算耗时
+    start_time = datetime.now()  # 墙上时间，仅用于日志展示
     logger.info(f"⏰ 服务启动时间: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
-    
-    # 初始化日志
-    setup_uvicorn_log()
     logger.info("🟢 FastAPI 项目启动日志初始化完成！")
-    # 创建数据库表
+    logger.debug("⚙️ 配置文件路径: %s", ENV_PATH)
     db_manager = get_db_manager()
-    # 根据配置决定是否创建数据库表
-    if settings.AUTO_CREATE_TABLES:
-        db_manager.create_all()  # 确保数据库表创建
-        logger.info("🟢 数据库表创建完成！")
-    logger.info("🚀 应用启动，连接 Redis...")
-    logger.info(
-    "⚙️ %sRedis连接参数 - host: %s, url: %s",
-        " ",
-        settings.REDIS_HOST,
-        settings.REDIS_URL
-    )
-    await redis_client.connect()  # 启动时连接 Redis
-    logger.info("🟢 redis连接成功！")
+
+    async def _create_tables():
+        # 根据配置决定是否创建数据库表，同步DDL放到线程中执行，不阻塞事件循环
+        if settings.AUTO_CREATE_TABLES:
+            await asyncio.to_thread(db_manager.create_all)  # 确保数据库表创建
+            logger.info("🟢 数据库表创建完成！")
+
+    async def _connect_redis():
+        logger.info("🚀 应用启动，连接 Redis...")
+        logger.info(
+        "⚙️ %sRedis连接参数 - host: %s, url: %s",
+            " ",
+            settings.REDIS_HOST,
+            settings.REDIS_URL
+        )
+        await redis_client.connect()  # 启动时连接 Redis
+        logger.info("🟢 redis连接成功！")
+
+    async def _prewarm_pools():
+        # 预热各数据源的异步连接池，失败只记录日志，不影响启动
+        if settings.POOL_PREWARM_SIZE > 0:
+            for name in db_manager.get_all_source_names():
+                try:
+                    await db_manager.prewarm(name, settings.POOL_PREWARM_SIZE)
+                except Exception as e:
+                    logger.warning(f"数据源 {name} 连接池预热失败: {e}")
+
+    # 建表、连接Redis与连接池预热互不依赖，并发执行，启动耗时取最大值而非之和
+    await asyncio.gather(_create_tables(), _connect_redis(), _prewarm_pools())
 
     logger.info(f"🗄️ 数据库连接: {settings.SQLITE_DATABASE_URI}, 绝对路径为：{os.path.abspath('./app/' + settings.SQLITE_FILE_NAME)}")
     # 计算启动耗时
-    elapsed_time = (datetime.now() - start_time).total_seconds()
+    elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
     logger.info(f"🔥 服务启动成功！启动耗时: {elapsed_time:.2f}秒") 
     
     yield
@@ -65,14 +93,17 @@ async def lifespan(app: FastAPI):
     logger.info(f"⏰ 服务关闭时间: {shutdown_time.strftime('%Y-%m-%d %H:%M:%S')}")
     # 关闭时执行
     logger.info("已关闭")
+    stop_log_listener()  # 写完队列中剩余的日志并停止后台日志线程
 
 
 
 
 
 def create_app() -> FastAPI:
+    settings = get_settings()
     app = FastAPI(
                 lifespan=lifespan,
+                default_response_class=ORJSONResponse,  # 默认使用orjson序列化响应，比标准库json更快
                 docs_url="/docs" if settings.SWAGGER_ENABLE else None,
                 redoc_url=None,
                 title="{{ cookiecutter.project_name }}",
@@ -90,8 +121,11 @@ def create_app() -> FastAPI:
                 ],
                 )
 
+    # CORS源只计算一次，以只读元组形式挂到应用实例上，进程内共享
+    app.state.cors_origins = tuple(settings.all_cors_origins)
+
     # 设置所有中间件
-    setup_middlewares(app)
+    setup_middlewares(app, settings, app.state.cors_origins)
     logger.info("⚡ [create_app] 中间件设置完成")
 
     # 注册api的路由对象
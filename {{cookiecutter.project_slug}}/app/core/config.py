@@ -1,3 +1,5 @@
+from functools import cached_property, lru_cache
+import json
 from pathlib import Path
 import secrets
 import warnings
@@ -12,34 +14,37 @@ from pydantic import (
     model_validator,
 )
 from pydantic_core import MultiHostUrl
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from pydantic_settings import BaseSettings, NoDecode, SettingsConfigDict
 from typing_extensions import Self
 
 
 # 获取项目根目录（即 .env 所在根目录）
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 ENV_PATH = PROJECT_ROOT / ".env"
-print(f"项目根目录={ENV_PATH}")
 
 # CORS配置解析函数
-def parse_cors(v: Any) -> list[str] | str:
+def parse_cors(v: Any) -> tuple[str, ...]:
     """
-    解析CORS配置，支持字符串（逗号分隔）或列表格式
+    解析CORS配置，支持字符串（逗号分隔或JSON数组）或列表格式
+    一次遍历完成拆分、去空白与去除末尾"/"，返回不可变的规范化元组
 
     Args:
         v: 输入的CORS配置，可以是字符串或列表
 
     Returns:
-        解析后的CORS源列表或原始字符串
+        解析后的CORS源元组
 
     Raises:
         ValueError: 当输入不是有效的CORS配置格式时
     """
-    if isinstance(v, str) and not v.startswith("["):
-        return [i.strip() for i in v.split(",")]
-    elif isinstance(v, list | str):
-        return v
-    raise ValueError(v)
+    if isinstance(v, str):
+        parts = json.loads(v) if v.startswith("[") else v.split(",")
+    elif isinstance(v, list | tuple):
+        parts = v
+    else:
+        raise ValueError(v)
+    origins = (p.strip().rstrip("/") for p in parts)
+    return tuple(origin for origin in origins if origin)
 
 
 class Settings(BaseSettings):
@@ -64,6 +69,7 @@ class Settings(BaseSettings):
     AUTO_CREATE_TABLES:  bool = False       # 控制是否自动创建表
     ENABLE_DEBUG_PYTEST: bool = False       # 开启Pytest进行测试   
     LOG_LEVEL: str = "INFO"
+    UVICORN_ACCESS_LOG: bool = True         # 是否输出uvicorn访问日志，生产环境可设置为False以减少每个请求的日志开销
 
     SWAGGER_ENABLE: bool | None = None  # 是否启用Swagger文档
 
@@ -75,27 +81,19 @@ class Settings(BaseSettings):
     FRONTEND_HOST: str = "http://localhost:5173"  # 前端应用地址
     ENVIRONMENT: Literal["local", "staging", "production"] = "local"  # 运行环境
 
-    # CORS配置
+    # CORS配置（NoDecode: 环境变量原样交给 parse_cors 解析，兼容逗号分隔格式）
     BACKEND_CORS_ORIGINS: Annotated[
-        list[str] | str, BeforeValidator(parse_cors)
-    ] = ["http://localhost:8000", "http://localhost:3000"]  # 修改默认值
-  
+        tuple[str, ...], NoDecode, BeforeValidator(parse_cors)
+    ] = ("http://localhost:8000", "http://localhost:3000")  # 修改默认值
+
     @computed_field  # type: ignore[prop-decorator]
-    @property
-    def all_cors_origins(self) -> list[str]:
+    @cached_property
+    def all_cors_origins(self) -> tuple[str, ...]:
         """
         获取所有CORS源，包括前端地址
         """
-        origins = []
-        if isinstance(self.BACKEND_CORS_ORIGINS, list):
-            origins.extend(self.BACKEND_CORS_ORIGINS)
-        elif isinstance(self.BACKEND_CORS_ORIGINS, str):
-            origins.extend([i.strip() for i in self.BACKEND_CORS_ORIGINS.split(",")])
-        
-        if self.FRONTEND_HOST:
-            origins.append(self.FRONTEND_HOST)
-            
-        return [origin.rstrip("/") for origin in origins]
+        frontend = (self.FRONTEND_HOST.rstrip("/"),) if self.FRONTEND_HOST else ()
+        return self.BACKEND_CORS_ORIGINS + frontend
 
 
     # CORS中间件配置
@@ -111,9 +109,25 @@ class Settings(BaseSettings):
 
     # 数据库连接池公共的参数配置项
     POOL_SIZE: int = 50         # 连接池大小
-    MAX_OVERFLOW: int = 30      # 最大溢出连接数
+    MAX_OVERFLOW: int | None = None  # 最大溢出连接数，未设置时与 POOL_SIZE 相同
     POOL_TIMEOUT: int = 30      # 等待连接的最大时间（秒）
     POOL_RECYCLE: int = 3600    # 每小时回收连接
+    # 连接检出前是否先执行 SELECT 1 预检。每次检出多一次网络往返，且在 PgBouncer 事务模式下会留下
+    # idle in transaction 的后端连接；默认关闭，依赖 POOL_RECYCLE 回收陈旧连接，连接经常被中间设备断开时再开启
+    POOL_PRE_PING: bool = False
+    POOL_PREWARM_SIZE: int = 0  # 启动时为每个异步连接池预先建立的连接数，0 表示不预热（上限为各连接池的 pool_size）
+    # 数据源YAML配置解析结果的磁盘缓存目录（如 ~/.cache/<项目名>），未设置时不写磁盘缓存，仅使用进程内缓存。
+    # 缓存内容含数据库密码，文件以 0600 权限创建，请勿指向共享目录
+    DB_CONFIG_CACHE_DIR: str | None = None
+
+    @model_validator(mode="after")
+    def _set_default_max_overflow(self) -> Self:
+        """
+        未设置最大溢出连接数时，默认与连接池大小相同
+        """
+        if self.MAX_OVERFLOW is None:
+            self.MAX_OVERFLOW = self.POOL_SIZE
+        return self
 
     # PostgreSQL配置
     POSTGRES_SERVER: str = "localhost"  # PostgreSQL服务器地址
@@ -121,13 +135,16 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "postgres"  # PostgreSQL用户名
     POSTGRES_PASSWORD: str = ""    # PostgreSQL密码
     POSTGRES_DB: str = "app"    # PostgreSQL数据库名称
+    # 建表前是否执行 CREATE EXTENSION IF NOT EXISTS（如 pg_trgm）。需要建扩展的权限，应用账号通常没有，
+    # 默认关闭，由DBA预先执行一次；应用账号有权限时可开启
+    POSTGRES_CREATE_EXTENSIONS: bool = False
 
     # SQLite配置
     SQLITE_FILE_NAME: str = "database.db"  # SQLite数据库文件名
     USE_SQLITE: bool = True  # 是否使用SQLite，默认为True以便于开发
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
         """
         构建SQLAlchemy数据库URI
@@ -142,7 +159,7 @@ class Settings(BaseSettings):
         )
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def SQLITE_DATABASE_URI(self) -> str:
         """
         构建SQLite数据库URI
@@ -156,7 +173,7 @@ class Settings(BaseSettings):
         return f"sqlite:///{db_path.as_posix()}"
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def SQLITE_CONNECT_ARGS(self) -> Dict[str, bool]:
         """
         SQLite连接参数
@@ -192,7 +209,7 @@ class Settings(BaseSettings):
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = 48  # 密码重置令牌过期小时数
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def emails_enabled(self) -> bool:
         """
         检查邮件功能是否已配置启用
@@ -250,7 +267,7 @@ class Settings(BaseSettings):
     RATE_LIMIT_PER_MINUTE: int = 60
 
     @computed_field  # type: ignore[prop-decorator]
-    @property
+    @cached_property
     def redis_uri(self) -> str:
         """
         自动生成 Redis 连接 URI
@@ -266,5 +283,14 @@ class Settings(BaseSettings):
 
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    获取配置对象（进程内只构建一次，避免重复解析.env与执行校验）
+    计算属性均为 cached_property，首次访问后缓存结果
+    """
+    return Settings()  # type: ignore
+
+
 # 实例化配置对象，供应用程序其他部分使用
-settings = Settings()  # type: ignore
+settings = get_settings()
@@ -1,8 +1,8 @@
-import time
 from datetime import datetime, timezone
-from functools import wraps
 from typing import Type, TypeVar, Generic, Any
 
+from pydantic import BaseModel
+from sqlalchemy import insert, inspect, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlmodel import Session, SQLModel
 
@@ -26,8 +26,27 @@ T_ID = TypeVar('T_ID', bound=Any)  # 表示主键 ID 的类型（如 int, str, U
 class CRUDBase(Generic[T, T_ID]):  # 泛型类，支持动态绑定模型类型和主键类型
     def __init__(self, model: Type[T]):
         self.model = model  # 保存具体的模型类（如 User, Product）
+        self._update_fields = frozenset(model.model_fields) - {"id", "version"}  # 允许更新的字段，主键和版本号不可直接修改
+
+    def _can_insert_returning(self, session: Session) -> bool:
+        """
+        是否可走 INSERT ... RETURNING 快速路径：数据库支持 RETURNING，且模型没有关联关系、没有 before_insert/after_insert 监听
+        （快速路径是 Core 语句，不经过 ORM 工作单元，不会触发映射器事件与关联级联）
+        """
+        mapper = inspect(self.model)
+        return (
+            session.get_bind().dialect.insert_returning
+            and not mapper.relationships
+            and not mapper.dispatch.before_insert
+            and not mapper.dispatch.after_insert
+        )
 
     def create(self, session: Session, obj_in: T) -> T:
+        """
+        创建实体
+        满足 _can_insert_returning 时插入与回读合并为一次往返，只写入显式设置过的字段（含显式的 None），
+        其余字段由列默认值生成；此路径同样不触发 Session 级的 flush 事件，依赖这些事件的模型需在子类中覆盖本方法
+        """
         try:
             # 检查输入对象类型并尝试转换
             if not isinstance(obj_in, self.model):
@@ -39,6 +58,12 @@ class CRUDBase(Generic[T, T_ID]):  # 泛型类，支持动态绑定模型类型
                     raise ValueError(f"Input object cannot be converted to {self.model.__name__}: {str(e)}")
             else:
                 db_obj = obj_in  # 如果已经是正确的类型，直接使用
+            if self._can_insert_returning(session):
+                # 支持 INSERT ... RETURNING 的数据库（PostgreSQL、SQLite>=3.35等），插入与回读合并为一次往返
+                stmt = insert(self.model).values(**db_obj.model_dump(exclude_unset=True)).returning(self.model)
+                db_obj = session.scalars(stmt).one()
+                session.commit()
+                return db_obj
             # 添加对象到会话
             session.add(db_obj)  # 将对象添加到会话
             session.commit()  # 提交事务（立即写入数据库）
@@ -70,39 +95,52 @@ class CRUDBase(Generic[T, T_ID]):  # 泛型类，支持动态绑定模型类型
         except SQLAlchemyError as e:
             raise DatabaseOperationError("read", str(e))
 
-    @staticmethod
-    def retry_on_conflict(max_retries=3, delay=0.1):
-        def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                retries = 0
-                while retries < max_retries:
-                    try:
-                        return func(*args, **kwargs)
-                    except DatabaseOperationError as e:
-                        if "Data has been modified" in str(e):
-                            retries += 1
-                            time.sleep(delay)
-                        else:
-                            raise
-                raise DatabaseOperationError("update", "Max retries reached")
-            return wrapper
-        return decorator
-
-    @retry_on_conflict(max_retries=3, delay=0.2)                        # 利用装饰器进行捕获处理乐观锁
-    def update(self, session: Session, entity_id: T_ID, obj_in: T) -> T:
-        entity = self.read(session, entity_id)                          # 先查询实体（确保存在）
-        if entity.version != obj_in.version:                            # 检查版本号
-            raise VersionConflictError(self.model.__name__, entity_id)
-        data = obj_in.dict(exclude_unset=True)                          # 仅提取非默认值的字段（避免覆盖未传字段）
-        for key, value in data.items():
-            setattr(entity, key, value)  # 动态更新字段
-        entity.version += 1  # 更新版本号
-        entity.updated_at = datetime.now(timezone.utc)  # 自动更新时间，增加时区信息
-        session.commit()
-        session.refresh(entity)
+    def update(self, session: Session, entity_id: T_ID, obj_in: T | BaseModel) -> T:
+        """
+        更新实体，乐观锁校验与更新合并为一条 UPDATE ... WHERE id=? AND version=? 语句
 
-        return entity
+        Args:
+            session: 数据库会话
+            entity_id: 实体ID
+            obj_in: 更新数据，携带 version 时才做乐观锁校验（如查询对象不含version）
+
+        Returns:
+            更新后的实体实例
+
+        Raises:
+            EntityNotFoundError: 如果实体不存在
+            VersionConflictError: 如果版本号不一致（已被其他事务修改）
+        """
+        data = obj_in.model_dump(exclude_unset=True)                    # 仅提取非默认值的字段（避免覆盖未传字段）
+        values = {key: data[key] for key in data.keys() & self._update_fields}
+        if not values:                                                  # 无可更新字段，直接返回，避免空提交
+            return self.read(session, entity_id)
+
+        conditions = [self.model.id == entity_id]
+        version = getattr(obj_in, "version", None)
+        if version is not None:
+            conditions.append(self.model.version == version)            # 版本号作为更新条件，由数据库原子判断
+        stmt = (
+            update(self.model)
+            .where(*conditions)
+            .values(**values, version=self.model.version + 1)           # 版本号自增，updated_at 由列的 onupdate 自动填充
+        )
+        try:
+            if session.get_bind().dialect.update_returning:
+                entity = session.scalars(stmt.returning(self.model)).one_or_none()  # 一次往返完成校验、更新与回读
+            else:
+                # 不支持 UPDATE ... RETURNING 的数据库（如MySQL），根据影响行数判断，再刷新实体
+                matched = session.execute(stmt).rowcount
+                entity = session.get(self.model, entity_id, populate_existing=True) if matched else None
+            if entity is None:
+                session.rollback()
+                self.read(session, entity_id)                           # 不存在时抛出 EntityNotFoundError
+                raise VersionConflictError(self.model.__name__, entity_id)
+            session.commit()
+            return entity
+        except SQLAlchemyError as e:
+            session.rollback()
+            raise DatabaseOperationError("update", str(e))
 
     def delete(self, session: Session, entity_id: T_ID) -> T:
         try:
@@ -1,4 +1,5 @@
 from contextlib import asynccontextmanager
+import orjson
 from fastapi import Depends
 from app.core.config import settings
 from app.core.database.db_manager import db_manager, DatabaseConfig, DatabaseType, ConnectionInfo
@@ -14,7 +15,8 @@ DB_MYSQL_NAME = "mysql"
 
 # 添加额外数据源的逻辑优化
 def _setup_additional_datasources():
-    """设置额外的数据源"""
+    """设置额外的数据源，启动信息汇总后只输出一条日志"""
+    summary = {}
     try:
         # 如果配置了MySQL，添加MySQL数据源
         if all([settings.MYSQL_USER, settings.MYSQL_PASSWORD, settings.MYSQL_DB]):
@@ -33,16 +35,16 @@ def _setup_additional_datasources():
                     'max_overflow': settings.MAX_OVERFLOW,
                     'pool_timeout': settings.POOL_TIMEOUT,
                     'pool_recycle': settings.POOL_RECYCLE,
-                    'pool_pre_ping': True,  # 添加连接预检
+                    'pool_pre_ping': settings.POOL_PRE_PING,  # 连接预检，默认关闭（见 settings.POOL_PRE_PING）
                 },
                 is_default=False,  # 明确设置为非默认
                 echo=settings.ENVIRONMENT == "local"  # 根据环境决定是否打印SQL
             )
 
             db_manager.add_source_from_config(mysql_config)
-            logger.info("🟢 成功添加MySQL数据源")
+            summary[DB_MYSQL_NAME] = "added"
         else:
-            logger.info("MySQL配置不完整，跳过MySQL数据源添加")
+            summary[DB_MYSQL_NAME] = "skipped: incomplete config"  # MySQL配置不完整，跳过MySQL数据源添加
             
         # 可以继续添加其他数据源
         # if settings.REDIS_URL:
@@ -50,8 +52,10 @@ def _setup_additional_datasources():
         #     pass
             
     except Exception as e:
+        summary["error"] = str(e)
         logger.error(f"设置额外数据源失败: {e}")
         # 不抛出异常，让系统继续使用默认数据源
+    logger.info("datasource_setup %s", orjson.dumps(summary).decode())
 
 # 执行额外数据源设置
 _setup_additional_datasources()
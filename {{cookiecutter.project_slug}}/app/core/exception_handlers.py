@@ -1,5 +1,5 @@
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import ResponseValidationError as FastAPIResponseValidationError
 from .logger import logger
 from .exceptions import EntityNotFoundError, BusinessException, ResponseValidationError
@@ -37,7 +37,7 @@ async def fastapi_response_validation_error_handler(request: Request, exc: FastA
 
     logger.error(f"FastAPI响应验证异常: {error_details}")
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=422,  # 使用标准的验证错误状态码
         content={
             "message": "响应数据验证失败",
@@ -1,8 +1,10 @@
 # logger_config.py
+import atexit
 import os
 import sys
 import logging
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+from queue import SimpleQueue
 from colorlog import ColoredFormatter
 
 from app.core.config import settings
@@ -76,16 +78,56 @@ logger = logging.getLogger()
 LOG_LEVEL = settings.LOG_LEVEL.upper()      # 通过配置文件读取,你可以调节为 INFO / WARNING
 logger.setLevel(getattr(logging, LOG_LEVEL))
 # logger.setLevel(logging.INFO)
-logger.addHandler(console_handler)  # 添加控制台日志处理器
-logger.addHandler(file_handler)     # 添加文件日志处理器
-logger.addHandler(file_size_handler)     # 添加文件日志处理器
-
-
-def setup_uvicorn_log():
-    """接管 uvicorn 默认日志"""
+log_handlers = (
+    console_handler,    # 控制台日志处理器
+    file_handler,       # 文件日志处理器
+    file_size_handler,  # 文件日志处理器
+)
+# 后台监听线程启动前（导入阶段、未运行应用生命周期的脚本）日志直接写控制台和文件
+for handler in log_handlers:
+    logger.addHandler(handler)
+
+# 业务线程只把日志记录放入队列，由后台线程统一写控制台和文件，避免I/O阻塞请求线程/事件循环
+log_queue = SimpleQueue()
+queue_handler = QueueHandler(log_queue)
+log_listener = QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+
+
+def start_log_listener():
+    """
+    启动后台日志线程，root logger 改为只挂 QueueHandler
+    在应用生命周期中（即 fork 出的工作进程内）调用，导入模块时不启动线程，避免 --workers/preload 时子进程继承已失效的线程
+    """
+    if queue_handler in logger.handlers:
+        return
+    log_listener.start()
+    for handler in log_handlers:
+        logger.removeHandler(handler)
+    logger.addHandler(queue_handler)
+
+
+def stop_log_listener():
+    """停止后台日志线程并写完队列中剩余的日志，root logger 恢复为直接写控制台和文件"""
+    if queue_handler not in logger.handlers:
+        return
+    logger.removeHandler(queue_handler)
+    for handler in log_handlers:
+        logger.addHandler(handler)
+    log_listener.stop()
+
+
+atexit.register(stop_log_listener)  # 未正常走完应用关闭流程时，进程退出前兜底写完剩余日志
+
+
+def setup_uvicorn_log(access_log: bool = True):
+    """
+    接管 uvicorn 默认日志
+    :param access_log: 是否输出访问日志，关闭后每个请求不再经过访问日志的格式化与写入（生产环境可关闭）
+    """
     uvicorn_log_config = ["uvicorn", "uvicorn.error", "uvicorn.access"]
     for logger_name in uvicorn_log_config:
         uvicorn_logger = logging.getLogger(logger_name)
         uvicorn_logger.handlers.clear()  # 清除原有 handler
         uvicorn_logger.propagate = True  # 让 uvicorn 日志走 root logger
+    logging.getLogger("uvicorn.access").disabled = not access_log
 
@@ -1,12 +1,21 @@
+import asyncio
 from typing import Annotated
 
 import redis.asyncio as redis
 from fastapi import Depends
 from redis.asyncio import Redis
+from redis.asyncio.retry import Retry
+from redis.backoff import EqualJitterBackoff
+from redis.exceptions import ConnectionError as RedisConnectionError
 from .logger import logger
 
 from .config import settings
 
+# 连接错误的重试策略：指数退避（0.05s 起，上限 2s）+ 随机抖动，避免首次失败即阻塞整秒或大量实例同时重连。
+# 只对连接错误重试，不对超时重试：超时可能发生在命令已发出之后，重试会使 INCR、LPUSH 等非幂等命令重复执行
+REDIS_RETRY_BACKOFF_BASE = 0.05
+REDIS_RETRY_BACKOFF_CAP = 2.0
+REDIS_MAX_RETRIES = 3
 
 class RedisClient:
     """Redis客户端封装类"""
@@ -15,14 +24,28 @@ class RedisClient:
         """初始化Redis客户端"""
         self.redis = None
         self._initialized = False
+        self._bound_attrs: set[str] = set()  # 已直接绑定到实例上的Redis原生属性名，断开连接时清除
+        self._proxies: dict = {}  # 未连接时的延迟代理函数，按属性名缓存
+        # 并发连接时只有一个协程真正创建客户端并 ping；锁与事件循环绑定，在 connect() 中按当前事件循环惰性创建
+        self._connect_lock: asyncio.Lock | None = None
+        self._connect_lock_loop = None
 
     async def connect(self):
         """确保Redis连接已初始化"""
-        if not self._initialized:
+        if self._initialized:
+            return
+        async with self._get_connect_lock():
+            if self._initialized:  # 等锁期间已由其他协程完成连接
+                return
             self.redis = redis.Redis.from_url(
                 settings.redis_uri,
                 decode_responses=True,
-                max_connections=10
+                max_connections=10,
+                retry=Retry(
+                    EqualJitterBackoff(cap=REDIS_RETRY_BACKOFF_CAP, base=REDIS_RETRY_BACKOFF_BASE),
+                    REDIS_MAX_RETRIES,
+                    supported_errors=(RedisConnectionError,),
+                ),
             )
             try:
                 await self.redis.ping()  # 确保 Redis 已连接
@@ -30,6 +53,43 @@ class RedisClient:
             except Exception as e:
                 self.redis = None
                 raise ConnectionError(f"Failed to connect to Redis: {str(e)}")
+            self._bind_fast_paths()
+
+    def _get_connect_lock(self) -> asyncio.Lock:
+        """
+        获取当前事件循环的连接锁
+        redis_client 是模块级单例，会被不同的事件循环使用（如每个 TestClient、每次应用生命周期），
+        asyncio.Lock 不能跨事件循环使用，事件循环变化时重新创建
+        """
+        loop = asyncio.get_running_loop()
+        if self._connect_lock is None or self._connect_lock_loop is not loop:
+            self._connect_lock = asyncio.Lock()
+            self._connect_lock_loop = loop
+        return self._connect_lock
+
+    def _bind_fast_paths(self):
+        """
+        连接成功后，把常用方法直接替换为已连接的实现，之后调用不再判断 _initialized
+        close() 时随 _bound_attrs 一并解除，恢复为类上带连接检查的方法
+        """
+        fast_paths = {
+            "get": self.redis.get,
+            "delete": self._delete_fast,
+            "info": self.redis.info,
+            "set": self._set_fast,
+        }
+        self.__dict__.update(fast_paths)
+        self._bound_attrs.update(fast_paths)
+
+    def _set_fast(self, key, value, expire=None, nx=None, ex=None):
+        """已连接时的 set，参数含义同 set()"""
+        if expire is not None and ex is None:
+            ex = expire
+        return self.redis.set(key, value, nx=nx, ex=ex)
+
+    async def _delete_fast(self, key):
+        """已连接时的 delete，与 delete() 一样不返回删除数量"""
+        await self.redis.delete(key)
 
     async def close(self):
         """关闭Redis连接"""
@@ -37,6 +97,10 @@ class RedisClient:
             await self.redis.aclose()
             self.redis = None
         self._initialized = False
+        # 解除绑定在实例上的旧连接方法，之后的访问重新经过 __getattr__
+        for name in self._bound_attrs:
+            self.__dict__.pop(name, None)
+        self._bound_attrs.clear()
 
     async def get(self, key):
         """获取键值"""
@@ -84,35 +148,25 @@ class RedisClient:
         支持访问Redis原生命令
         注意: 此方法返回的是一个代理函数，需要使用await调用
         用法: await redis_client.some_redis_command(args)
+        已连接时直接把Redis原生属性绑定到实例上，之后的访问不再经过 __getattr__
         """
-        # 获取Redis原生方法
-        redis_attr = None
-        if self.redis is None:
-            # 需要先连接Redis
-            async def _proxy_method(*args, **kwargs):
-                # 延迟初始化
-                await self.connect()
-                real_method = getattr(self.redis, name)
-                return await real_method(*args, **kwargs)
-
-            return _proxy_method
-        else:
-            # Redis客户端已初始化
-            redis_attr = getattr(self.redis, name)
-
-            # 如果是异步方法，创建代理
-            if callable(redis_attr):
-                async def _proxy_method(*args, **kwargs):
-                    # 确保连接存在
-                    if not self._initialized:
-                        await self.connect()
-                    real_method = getattr(self.redis, name)
-                    return await real_method(*args, **kwargs)
-
-                return _proxy_method
-            else:
-                # 返回普通属性
-                return redis_attr
+        if self.redis is None or not self._initialized:
+            # 需要先连接Redis，代理函数按属性名只创建一次
+            proxy = self._proxies.get(name)
+            if proxy is None:
+                async def proxy(*args, **kwargs):
+                    # 延迟初始化
+                    await self.connect()
+                    return await getattr(self.redis, name)(*args, **kwargs)
+
+                self._proxies[name] = proxy
+            return proxy
+
+        # Redis客户端已初始化
+        redis_attr = getattr(self.redis, name)
+        self.__dict__[name] = redis_attr
+        self._bound_attrs.add(name)
+        return redis_attr
 
 
 # 全局单例 redis_client
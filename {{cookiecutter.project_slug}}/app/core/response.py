@@ -1,14 +1,25 @@
 # core/response.py
-from fastapi.responses import JSONResponse
+from functools import lru_cache
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from starlette import status
 from fastapi import Request
 from fastapi.templating import Jinja2Templates
+from jinja2 import Template
 from pathlib import Path
 
 # 创建模板引擎实例
 templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
 
 
+@lru_cache(maxsize=None)
+def get_template(name: str) -> Template:
+    """
+    获取已编译的模板（首次使用时加载并缓存，避免导入时访问文件系统）
+    直接渲染模板可省去 TemplateResponse 每次的上下文处理器、后台任务等额外处理
+    """
+    return templates.get_template(name)
+
+
 # 统一返回格式
 def html_response(data=None, request: Request = None, msg="success", code=0):
     """
@@ -21,22 +32,19 @@ def html_response(data=None, request: Request = None, msg="success", code=0):
         code: 响应代码
     
     Returns:
-        TemplateResponse: 渲染后的HTML响应
+        HTMLResponse: 渲染后的HTML响应
     """
     if request is None:
         # 如果没有提供request，无法返回HTML响应，回退到JSON
         return success(data=data, msg=msg, code=code)
         
-    return templates.TemplateResponse(
-        "response.html",
-        {
-            "request": request,
-            "title": "API Response",
-            "code": code,
-            "msg": msg,
-            "data": data
-        }
-    )
+    return HTMLResponse(get_template("response.html").render(
+        request=request,
+        title="API Response",
+        code=code,
+        msg=msg,
+        data=data
+    ))
 
 
 def html_response_welcome(data=None, request: Request = None):
@@ -48,20 +56,17 @@ def html_response_welcome(data=None, request: Request = None):
         request: FastAPI/Starlette请求对象
 
     Returns:
-        TemplateResponse: 渲染后的HTML响应
+        HTMLResponse: 渲染后的HTML响应
     """
     if request is None:
         # 如果没有提供request，无法返回HTML响应，回退到JSON
         return success(data=data)
 
-    return templates.TemplateResponse(
-        "welcome.html",
-        {
-            "request": request,
-            "title": data["title"] if data else "欢迎访问我们的网站",
-            "subtitle": data["subtitle"] if data else "探索无限可能，发现精彩内容。我们致力于为您提供最佳的用户体验和最优质的服务。",
-        }
-    )
+    return HTMLResponse(get_template("welcome.html").render(
+        request=request,
+        title=data["title"] if data else "欢迎访问我们的网站",
+        subtitle=data["subtitle"] if data else "探索无限可能，发现精彩内容。我们致力于为您提供最佳的用户体验和最优质的服务。",
+    ))
 
 
 # 统一返回格式
@@ -72,8 +77,8 @@ def success(data=None, status_code=status.HTTP_200_OK, msg="success", code=0, re
     }
     if data or return_null:
         content["data"] = data
-    return JSONResponse(status_code=status_code, content=content)
+    return ORJSONResponse(status_code=status_code, content=content)
 
 
 def fail(msg="error", status_code=status.HTTP_200_OK, code=-1):
-    return JSONResponse(status_code=status_code, content={"code": code, "msg": msg})
+    return ORJSONResponse(status_code=status_code, content={"code": code, "msg": msg})
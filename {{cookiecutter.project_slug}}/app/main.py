@@ -29,7 +29,7 @@ async def middleware_exception_handler(request: Request, call_next):
         return fail(msg=f"{exc}")
 
 @app.get("/")
-def read_root(request: Request):
+async def read_root(request: Request):  # 仅渲染模板、无阻塞I/O，使用 async def 直接在事件循环中执行，省去线程池调度
     return html_response_welcome(data={
         "title": "欢迎访问我们的网站",
         "subtitle": "探索无限可能，发现精彩内容。我们致力于为您提供最佳的用户体验和最优质的服务。"
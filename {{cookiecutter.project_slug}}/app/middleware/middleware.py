@@ -4,16 +4,18 @@ from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.logger import logger
-from app.core.config import settings
+from app.core.config import Settings
 from .skip import SkipPathMiddleware
 from app.api import (api_router, v1_router, hero)  # 修改为引入api_router
 
 
-def setup_middlewares(app: FastAPI) -> None:
+def setup_middlewares(app: FastAPI, settings: Settings, cors_origins: tuple[str, ...]) -> None:
     """
     设置所有中间件
     Args:
         app: FastAPI应用实例
+        settings: 应用配置对象
+        cors_origins: 预先计算好的CORS源（见 app.state.cors_origins）
     """
     if settings.ENABLE_DEBUG_PYTEST:
         # PYTEST测试环境-跳过验证路径权限列表
@@ -36,37 +38,39 @@ def setup_middlewares(app: FastAPI) -> None:
     # 添加skip中间件
     app.add_middleware(SkipPathMiddleware, skip_paths=skip_paths)
     # 设置CORS中间件
-    setup_cors_middleware(app)
+    setup_cors_middleware(app, settings, cors_origins)
     # 在此处添加其他中间件
     # setup_gzip_middleware(app)
     # setup_https_redirect_middleware(app)
     # 等等...
 
 
-def setup_cors_middleware(app: FastAPI) -> None:
+def setup_cors_middleware(app: FastAPI, settings: Settings, cors_origins: tuple[str, ...]) -> None:
     """
     设置CORS中间件
 
     Args:
         app: FastAPI应用实例
+        settings: 应用配置对象
+        cors_origins: 预先计算好的CORS源
     """
-    if settings.all_cors_origins:
+    if cors_origins:
         app.add_middleware(
             CORSMiddleware,
-            allow_origins=settings.all_cors_origins,
+            allow_origins=frozenset(cors_origins),  # 集合做O(1)的来源匹配
             allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
             allow_methods=settings.CORS_ALLOW_METHODS,
             allow_headers=settings.CORS_ALLOW_HEADERS,
         )
 
 
-def get_paths(version_router: str, bi_router: APIRouter) -> List[str]:
+def get_paths(version_router: APIRouter, bi_router: APIRouter) -> List[str]:
     """
     生成动态的路由映射路径列表
     
     Args:
-        base_prefix: 基础路径前缀 (如 "/api/v1")
-        routers: 路由器列表
+        version_router: 版本路由器 (如 v1_router)
+        bi_router: 业务路由器 (如 hero.router)
     
     Returns:
         包含完整路径的列表
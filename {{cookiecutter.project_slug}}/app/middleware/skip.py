@@ -1,4 +1,6 @@
 import fnmatch
+import logging
+import re
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 from app.core.logger import logger
@@ -12,14 +14,21 @@ class SkipPathMiddleware(BaseHTTPMiddleware):
     def __init__(self, app, skip_paths: list):
         super().__init__(app)
         self.skip_paths = skip_paths
+        # 启动时把全部通配规则合并编译为一个正则，每个请求只需一次匹配（无规则时为 None，避免空正则匹配所有路径）
+        self._skip_re = re.compile(
+            "|".join(f"(?:{fnmatch.translate(skip_path)})" for skip_path in skip_paths)
+        ) if skip_paths else None
 
     async def dispatch(self, request: Request, call_next) -> Response:
         path = request.url.path
-        logger.info(f"请求路径: {path}")
-        for skip_path in self.skip_paths:
-            if fnmatch.fnmatch(path, skip_path):
-                logger.info(f"路径 {path} 被中间件跳过匹配规则: {skip_path}")
-                request.state.skip_next_middlewares = True
-                break
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("请求路径: %s", path)
+        if self._skip_re is not None and self._skip_re.match(path):
+            if debug:
+                # 仅调试时才逐条定位命中的规则
+                skip_path = next(p for p in self.skip_paths if fnmatch.fnmatch(path, p))
+                logger.debug("路径 %s 被中间件跳过匹配规则: %s", path, skip_path)
+            request.state.skip_next_middlewares = True
 
         return await call_next(request)
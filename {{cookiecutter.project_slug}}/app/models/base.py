@@ -6,7 +6,7 @@ from uuid import UUID, uuid4
 from pydantic import field_serializer, Field as PydanticField
 from sqlmodel import Field, SQLModel, Index, Text, Column, DateTime, func, Integer, String
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import event
+from sqlalchemy import literal_column
 
 
 T_ID = TypeVar("T_ID", int, str, UUID)  # 泛型 ID，可以是 int 或 str，后续可以扩展 UUID
@@ -79,7 +79,12 @@ class StrMixin(SQLModel):
 
 
 class BaseSqlModel(SQLModel):
-    version: int = Field(default=0, nullable=False, description="乐观锁版本号")
+    version: int = Field(
+        default=0,
+        nullable=False,
+        description="乐观锁版本号",
+        sa_column_kwargs={"onupdate": literal_column("version + 1")},  # ORM 更新时在 UPDATE 语句中自增，无需 Python 事件回调
+    )
     created_at: datetime = Field(default_factory=datetime.now, nullable=False, description="创建时间")
     """
     采用 sa_type、sa_column_kwargs完全自定义列的方式 来避免如下错误：
@@ -136,7 +141,8 @@ class BaseSqlModel(SQLModel):
         """
         if value is None:
             return None
-        return value.strftime('%Y/%m/%d %H:%M:%S')
+        # 等价于 strftime('%Y/%m/%d %H:%M:%S')，直接格式化字段，省去每次解析格式串
+        return f"{value.year:04d}/{value.month:02d}/{value.day:02d} {value.hour:02d}:{value.minute:02d}:{value.second:02d}"
     
     def soft_delete(self) -> None:
         """
@@ -186,12 +192,3 @@ class BaseSqlModelWithOperator(BaseSqlModel):
             }
         }
     }
-
-# 设置事件监听器，自动增加版本号
-@event.listens_for(BaseSqlModel, 'before_update', propagate=True)
-def increment_version(mapper, connection, target):
-    """
-    在更新前自动增加版本号
-    """
-    target.version += 1
-
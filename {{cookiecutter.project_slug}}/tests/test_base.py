@@ -1,11 +1,13 @@
 import logging
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlmodel import Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool, StaticPool
+from sqlmodel import Session, SQLModel
 from sqlalchemy.orm import sessionmaker
 
-from app.core.database.db_manager import get_db_session
+from app.core.database.db_manager import get_db_session, get_async_db_session
 from app.app_factory import create_app
 from app.core.config import settings
 
@@ -26,16 +28,38 @@ SessionLocal = sessionmaker(autocommit=False,
 
 """
 
+def _set_sqlite_pragma(dbapi_connection, connection_record):
+    """测试库无需持久化保证：关闭同步落盘，临时表放内存（内存库不支持WAL，journal_mode 保持 memory）"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.close()
+
+
 class TestBase:
     """测试基类"""
     
     # 使用类变量存储数据库配置
-    SQLALCHEMY_DATABASE_URL = "sqlite:///./tests/test.db"
-    engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+    # 共享缓存的内存库：同进程内的同步/异步连接访问同一份数据，测试期间不写磁盘；
+    # 同步引擎使用 StaticPool 始终持有一个连接，保证内存库在整个测试会话内存活
+    SQLALCHEMY_DATABASE_URL = "sqlite:///file:testdb?mode=memory&cache=shared&uri=true"
+    engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool)
     SessionLocal = sessionmaker(autocommit=False, 
                             autoflush=False, bind=engine,
+                            expire_on_commit=False,
                             class_=Session
                             ) 
+    # 异步引擎与同步引擎指向同一个测试库；每个测试的 TestClient 使用独立的事件循环，不复用连接（NullPool）
+    ASYNC_DATABASE_URL = "sqlite+aiosqlite:///file:testdb?mode=memory&cache=shared&uri=true"
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=NullPool)
+    # 测试引擎新建连接时设置 SQLite PRAGMA
+    event.listen(engine, "connect", _set_sqlite_pragma)
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragma)
+    AsyncSessionLocal = async_sessionmaker(autocommit=False,
+                            autoflush=False, bind=async_engine,
+                            expire_on_commit=False,
+                            class_=AsyncSession
+                            )
     
     API_PREFIX = "/api/v1"  # API前缀
 
@@ -48,12 +72,19 @@ class TestBase:
         finally:
             db.close()
 
-    @pytest.fixture
+    @classmethod
+    async def get_async_db(cls):
+        """获取异步数据库会话"""
+        async with cls.AsyncSessionLocal() as db:
+            yield db
+
+    @pytest.fixture(scope="module")
     def client(self, headers):
-        """FastAPI测试客户端"""
+        """FastAPI测试客户端，同一模块内的测试共用一个应用实例，避免每个测试重复创建应用、注册路由和构建模型Schema"""
         app = create_app()
         # 覆盖默认的数据库session
         app.dependency_overrides[get_db_session] = self.get_db
+        app.dependency_overrides[get_async_db_session] = self.get_async_db
         with TestClient(app, headers=headers) as client:
             yield client
 
@@ -66,6 +97,13 @@ class TestBase:
             "Content-Type": "application/json"
         }
 
+    @pytest.fixture(scope="session", autouse=True)
+    def setup_db(self):
+        """整个测试会话只建表、删表一次（表结构在会话内不变），避免每个测试模块重复执行DDL"""
+        SQLModel.metadata.create_all(bind=self.engine)
+        yield
+        SQLModel.metadata.drop_all(bind=self.engine)
+
     @pytest.fixture(scope="session", autouse=True)
     def override_settings(self):
         """覆盖全局设置"""
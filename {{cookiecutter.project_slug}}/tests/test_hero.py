@@ -1,4 +1,9 @@
 import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import StaticPool
+
+from app.core.database.db_manager import get_async_db_session
 from app.models.hero import Hero
 from tests.test_base import TestBase
 
@@ -6,15 +11,14 @@ from tests.test_base import TestBase
 class TestHeroAPI(TestBase):
     """Test class for Hero API endpoints"""
 
-    # 自动应用的 fixture，不需要在测试函数中传入
-    @pytest.fixture(scope="module", autouse=True)
-    def setup_db(self):
-        print("Creating tables...")
-        # 先创建Prompt相关的表，再创建Hero表，确保依赖关系正确
-        Hero.metadata.create_all(bind=self.engine)  # 创建数据库表
-        yield
-        print("Dropping tables...")
-        Hero.metadata.drop_all(bind=self.engine)  # 清理数据库表
+    @pytest.fixture(scope="module")
+    def seed_heroes(self):
+        """批量写入测试英雄，一个会话一次提交，不经过HTTP接口"""
+        with self.SessionLocal() as session:
+            heroes = [Hero(name=f"Hero{i}", age=20 + i, secret_name=f"Secret{i}") for i in range(5)]
+            session.add_all(heroes)
+            session.commit()
+        return heroes
 
     def test_create_hero(self, client):
         hero_data = {"name": "Superman", "age": 30, "secret_name": "Clark Kent"}
@@ -80,13 +84,8 @@ class TestHeroAPI(TestBase):
         response = client.delete(f"/api/v1/heroes/delete/{hero_id}")
         assert response.status_code == 200
 
-    def test_pagination(self, client):
+    def test_pagination(self, client, seed_heroes):
         """Test pagination with offset and limit parameters"""
-        # Create multiple test heroes for pagination
-        for i in range(5):
-            hero_data = {"name": f"Hero{i}", "age": 20 + i, "secret_name": f"Secret{i}"}
-            client.post(f"{self.API_PREFIX}/heroes/", json=hero_data)
-        
         # Test different pagination combinations
         test_cases = [(0, 2), (2, 2), (4, 1)]
         for offset, limit in test_cases:
@@ -94,4 +93,92 @@ class TestHeroAPI(TestBase):
             assert response.status_code == 200
             heroes = response.json()
             # 验证返回的英雄数量不超过limit
-            assert len(heroes) <= limit
\ No newline at end of file
+            assert len(heroes) <= limit
+
+    def test_filter_by_name(self, client):
+        """Test filtering heroes by name (case-insensitive contains) with total count"""
+        client.post(f"{self.API_PREFIX}/heroes/", json={"name": "Wonder Woman", "age": 30, "secret_name": "Diana"})
+
+        response = client.get(f"{self.API_PREFIX}/heroes?name=wonder&with_total=true")
+        assert response.status_code == 200
+        heroes = response.json()
+        assert len(heroes) >= 1
+        assert all("wonder" in hero["name"].lower() for hero in heroes)
+        assert int(response.headers["X-Total-Count"]) == len(heroes)
+
+    def test_total_count_on_static_pool(self, client, seed_heroes):
+        """Test with_total on a single-connection pool (the default SQLite StaticPool) counts on the request session"""
+        engine = create_async_engine(self.ASYNC_DATABASE_URL, poolclass=StaticPool)
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+        async def get_static_pool_db():
+            async with session_factory() as db:
+                yield db
+
+        client.app.dependency_overrides[get_async_db_session] = get_static_pool_db
+        try:
+            all_heroes = client.get(f"{self.API_PREFIX}/heroes?limit=100").json()
+            resets = []  # 连接归还时的重置（回滚）次数：只有请求会话归还一次，说明没有另开会话争用同一个连接
+            event.listen(engine.sync_engine, "reset", lambda *args: resets.append(args))
+            response = client.get(f"{self.API_PREFIX}/heroes?with_total=true&limit=2")
+            assert response.status_code == 200
+            assert len(response.json()) == 2
+            assert int(response.headers["X-Total-Count"]) == len(all_heroes)
+            assert len(resets) == 1
+        finally:
+            client.app.dependency_overrides[get_async_db_session] = self.get_async_db
+            client.portal.call(engine.dispose)
+
+    def test_keyset_pagination(self, client):
+        """Test cursor pagination with after_id"""
+        response = client.get(f"{self.API_PREFIX}/heroes?limit=100")
+        all_ids = [hero["id"] for hero in response.json()]
+
+        cursor, ids = 0, []
+        while cursor is not None:
+            response = client.get(f"{self.API_PREFIX}/heroes?after_id={cursor}&limit=2")
+            assert response.status_code == 200
+            page = response.json()
+            assert len(page) <= 2
+            ids.extend(hero["id"] for hero in page)
+            cursor = response.headers.get("X-Next-Cursor")
+        assert ids == all_ids
+
+    def test_partial_update_keeps_unset_fields(self, client):
+        """Test consecutive partial updates only touch the fields sent"""
+        hero_data = {"name": "Batman", "age": 35, "secret_name": "Bruce Wayne"}
+        hero_id = client.post(f"{self.API_PREFIX}/heroes/", json=hero_data).json()["id"]
+
+        for age in (36, 37):
+            response = client.put(f"{self.API_PREFIX}/heroes/update/{hero_id}", json={"age": age})
+            assert response.status_code == 200
+            updated_hero = response.json()
+            assert updated_hero["age"] == age
+            assert updated_hero["name"] == hero_data["name"]
+            assert updated_hero["secret_name"] == hero_data["secret_name"]
+
+    def test_list_query_validation(self, client):
+        """Test invalid list query parameters are rejected before hitting the database"""
+        for query in ("limit=0", "offset=-1", f"name={'x' * 101}"):
+            response = client.get(f"{self.API_PREFIX}/heroes?{query}")
+            assert response.status_code == 422
+
+    def test_list_and_detail_share_shape(self, client):
+        """Test list items and the detail response serialize None fields the same way"""
+        hero_data = {"name": "Nameless Ageless", "secret_name": "Unknown"}
+        hero_id = client.post(f"{self.API_PREFIX}/heroes/", json=hero_data).json()["id"]
+
+        response = client.get(f"{self.API_PREFIX}/heroes?name=Nameless Ageless")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json()[0]["age"] is None
+        assert response.json()[0] == client.get(f"{self.API_PREFIX}/heroes/get/{hero_id}").json()
+
+    def test_empty_update_is_noop(self, client):
+        """Test an update without any fields leaves the hero and its version untouched"""
+        hero = client.post(f"{self.API_PREFIX}/heroes/", json={"name": "Flash", "age": 28, "secret_name": "Barry Allen"}).json()
+
+        response = client.put(f"{self.API_PREFIX}/heroes/update/{hero['id']}", json={})
+        assert response.status_code == 200
+        assert response.json()["version"] == hero["version"]
+        assert response.json()["age"] == hero["age"]